@@ -7,9 +7,152 @@ science context.
 """
 
 from typing import Iterable
+import numpy as np
 import pandas as pd
 from pandas.api import types as pdt
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional
+    pa = None
+
+
+def _holds_strings(df: pd.DataFrame, col, dtype) -> bool:
+    """Return True if column ``col`` of ``df``, of dtype ``dtype``, holds text.
+
+    Non-object dtypes are judged from the dtype alone. Object columns can
+    hold anything, so their values are inspected as well.
+    """
+    if not pdt.is_string_dtype(dtype):
+        return False
+    if dtype != object:
+        return True
+    return pdt.infer_dtype(df[col], skipna=True) in ("string", "empty")
+
+
+def _is_arrow_backed(dtype) -> bool:
+    """Return True if ``dtype`` is a pandas string dtype stored in Arrow."""
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _from_arrow(s: pd.Series, stripped) -> pd.Series:
+    """Wrap Arrow-trimmed strings in a Series shaped like ``s``.
+
+    Missing values and the dtype are taken from ``s`` so the result is
+    indistinguishable from ``s.str.strip()``.
+    """
+    values = s.to_numpy(dtype=object)
+    stripped = stripped.to_numpy(zero_copy_only=False)
+    stripped = np.where(pd.isna(values), values, stripped)
+    return pd.Series(stripped, index=s.index, name=s.name, dtype=s.dtype)
+
+
+_str_strip = np.frompyfunc(str.strip, 1, 1)
+
+
+def _strip_python(s: pd.Series) -> pd.Series:
+    """Strip whitespace by calling :meth:`str.strip` directly on the values.
+
+    Used when pyarrow is unavailable. It skips the pandas string accessor
+    while keeping the dtype and missing values of ``s``. Values that are
+    not ``str`` make it fall back to :meth:`pandas.Series.str.strip`.
+    """
+    values = s.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    try:
+        stripped = _str_strip(np.where(missing, "", values))
+    except TypeError:
+        return s.str.strip()
+    stripped[missing] = values[missing]
+    return pd.Series(stripped, index=s.index, name=s.name, dtype=s.dtype)
+
+
+def _strip_series(s: pd.Series) -> pd.Series:
+    """Strip whitespace from a string Series, using Arrow's kernel when possible.
+
+    Object and Python-backed string columns are trimmed by
+    :func:`pyarrow.compute.utf8_trim_whitespace` instead of a Python-level
+    loop. The result keeps the dtype and missing values of ``s``. Columns
+    already stored in Arrow and columns holding non-string objects use
+    :meth:`pandas.Series.str.strip`; without pyarrow, :func:`_strip_python`
+    is used.
+    """
+    if _is_arrow_backed(s.dtype):
+        return s.str.strip()
+    if pa is None:
+        return _strip_python(s)
+
+    try:
+        values = pa.array(s.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return s.str.strip()
+    return _from_arrow(s, pc.utf8_trim_whitespace(values))
+
+
+def _strip_columns(df: pd.DataFrame, cols: list, dtypes: pd.Series) -> dict:
+    """Return the whitespace-stripped columns ``cols`` of ``df`` keyed by name.
+
+    When several columns need converting to Arrow, they are converted as a
+    single table, which pyarrow does on multiple threads. Columns that do
+    not convert to Arrow strings are handled one by one by
+    :func:`_strip_series`. ``dtypes`` is ``df.dtypes``, passed in by the
+    caller so it is only computed once.
+    """
+    batch = []
+    if pa is not None:
+        batch = [c for c in dict.fromkeys(cols) if not _is_arrow_backed(dtypes[c])]
+
+    stripped = {}
+    if len(batch) > 1:
+        try:
+            table = pa.Table.from_pandas(df[batch], preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+        if table is not None:
+            for c, column in zip(batch, table.columns):
+                if pa.types.is_string(column.type):
+                    stripped[c] = _from_arrow(df[c], pc.utf8_trim_whitespace(column))
+
+    for c in cols:
+        if c not in stripped:
+            stripped[c] = _strip_series(df[c])
+    return stripped
+
+
+def _quartiles(vals: np.ndarray) -> tuple:
+    """Return the 25th and 75th percentiles of ``vals``, ignoring NaN.
+
+    Only the order statistics needed for linear interpolation are placed
+    with :func:`numpy.partition`, an ``O(n)`` selection. The result matches
+    :meth:`pandas.Series.quantile` with its default settings.
+    """
+    valid = vals[~np.isnan(vals)]
+    n = valid.size
+    if n == 0:
+        return np.nan, np.nan
+
+    positions = (0.25 * (n - 1), 0.75 * (n - 1))
+    lows = [int(p) for p in positions]
+    highs = [min(k + 1, n - 1) for k in lows]
+    valid.partition(sorted(set(lows + highs)))
+    return tuple(
+        _lerp(valid[lo], valid[hi], p - lo)
+        for p, lo, hi in zip(positions, lows, highs)
+    )
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    """Interpolate between ``a`` and ``b`` exactly as NumPy's quantiles do.
+
+    NumPy interpolates from the nearer endpoint (from ``b`` once ``t`` is
+    at least 0.5), which can differ from ``a + (b - a) * t`` in the last bit.
+    """
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
+
 
 class DataCleaner:
     """Utility class for common :class:`pandas.DataFrame` cleaning operations.
@@ -46,11 +189,19 @@ class DataCleaner:
         -----
         This method does not modify the input DataFrame in-place.
         """
-        missing = [c for c in cols if c not in df.columns]
+        cols = list(cols)
+        col_set = set(df.columns)
+        missing = [c for c in cols if c not in col_set]
         if missing:
             raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-        return df.dropna(subset=list(cols))
+        subset = df[cols]
+        if all(isinstance(dt, np.dtype) and dt.kind in "iuf" for dt in subset.dtypes):
+            # Plain NumPy numeric columns: skip pandas' per-dtype isna dispatch.
+            invalid = np.isnan(subset.to_numpy(dtype=np.float64)).any(axis=1)
+        else:
+            invalid = subset.isna().to_numpy().any(axis=1)
+        return df.iloc[np.flatnonzero(~invalid)]
 
     def trim_strings(self, df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
         """Strip leading and trailing whitespace from string columns.
@@ -66,7 +217,7 @@ class DataCleaner:
         -------
         trimmed_df:
             A new DataFrame where the specified columns have their
-            string values stripped using :meth:`str.strip`.
+            string values stripped of leading and trailing whitespace.
 
         Raises
         ------
@@ -77,20 +228,26 @@ class DataCleaner:
 
         Notes
         -----
-        The original DataFrame is not modified; a copy is returned.
+        The original DataFrame is not modified. The result is a shallow
+        copy in which only the trimmed columns are new; the remaining
+        columns share their data with ``df``. On pandas 2.x, enabling
+        ``pd.options.mode.copy_on_write`` keeps later in-place edits of
+        those shared columns from reaching ``df``.
         """
         cols = list(cols)
-        missing = [c for c in cols if c not in df.columns]
+        col_set = set(df.columns)
+        missing = [c for c in cols if c not in col_set]
         if missing:
             raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-        non_string = [c for c in cols if not pdt.is_string_dtype(df[c])]
+        dtypes = df.dtypes
+        non_string = [c for c in cols if not _holds_strings(df, c, dtypes[c])]
         if non_string:
             raise TypeError(f"Columns are not string dtype: {non_string}")
 
-        result = df.copy()
-        for c in cols:
-            result[c] = result[c].str.strip()
+        result = df.copy(deep=False)
+        for c, stripped in _strip_columns(df, cols, dtypes).items():
+            result[c] = stripped
         return result
 
     def remove_outliers_iqr(
@@ -125,19 +282,23 @@ class DataCleaner:
         KeyError
             If ``col`` is not present in ``df``.
         TypeError
-            If ``col`` is not numeric.
+            If ``col`` is not an integer or floating point column.
         """
         if col not in df.columns:
             raise KeyError(f"Column '{col}' not found in DataFrame")
 
-        if not pdt.is_numeric_dtype(df[col]):
+        series = df[col]
+        if series.dtype.kind not in "iuf":
             raise TypeError(f"Column '{col}' must be numeric to compute IQR")
 
-        q1 = df[col].quantile(0.25)
-        q3 = df[col].quantile(0.75)
+        # One conversion to a native float64 buffer (no copy for float64
+        # columns); nullable extension dtypes have their NA mapped to NaN.
+        vals = series.to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+        q1, q3 = _quartiles(vals)
         iqr = q3 - q1
         lower = q1 - factor * iqr
         upper = q3 + factor * iqr
 
-        mask = (df[col] >= lower) & (df[col] <= upper)
-        return df.loc[mask].copy()
+        mask = np.greater_equal(vals, lower)
+        mask &= np.less_equal(vals, upper)
+        return df.take(np.flatnonzero(mask))
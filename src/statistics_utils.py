@@ -3,11 +3,238 @@
 The :class:`StatisticsUtils` class provides pure numerical helpers that
 do not depend on machine learning models. They are designed to be simple
 enough for unit testing while still reflecting real-world needs.
+
+The numerical work is done by module-level Numba kernels
+(:func:`_moving_average_nb`, :func:`_zscore_nb`, :func:`_min_max_scale_nb`)
+that take C-contiguous ``float64`` arrays. The class methods validate and
+convert their inputs before delegating to them; code that is itself
+compiled with Numba can call the kernels directly.
 """
 
+import functools
 from typing import Sequence
 import numpy as np
 
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional
+    bn = None
+
+try:
+    from numba import get_num_threads, njit, prange, types
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; NumPy implementations are used instead
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for :func:`numba.njit` that leaves the function uncompiled."""
+        return lambda func: func
+
+
+def _array_signatures(make):
+    """Build a kernel's signatures for writable and read-only input arrays.
+
+    ``make`` receives the type of the input array and returns the full
+    signature. Numba types read-only arrays separately, and pandas hands
+    them out for every Series under copy-on-write, so both are compiled.
+    Without numba there is nothing to compile and an empty list is returned.
+    """
+    if not _HAS_NUMBA:
+        return []
+    readonly = types.Array(types.float64, 1, "C", readonly=True)
+    return [make(types.float64[::1]), make(readonly)]
+
+
+# Above this many output values, moving_average splits the work across threads.
+_PARALLEL_SMA_MIN_SIZE = 1_000_000
+
+
+@functools.lru_cache(maxsize=32)
+def _uniform_kernel(w: int) -> np.ndarray:
+    """Read-only uniform averaging kernel of length ``w``, cached per size."""
+    kernel = np.full(w, 1.0 / w)
+    kernel.setflags(write=False)
+    return kernel
+
+
+@njit("float64(float64, int64, int64[::1])", cache=True)
+def _window_update_nb(x, sign, counts):
+    """Account for ``x`` entering (``sign=1``) or leaving (``sign=-1``) a window.
+
+    NaN, +inf and -inf are tallied in ``counts[0]``, ``counts[1]`` and
+    ``counts[2]``. The return value is what to add to the running sum of
+    the window's finite values.
+    """
+    if np.isfinite(x):
+        return sign * x
+    if np.isnan(x):
+        counts[0] += sign
+    elif x > 0:
+        counts[1] += sign
+    else:
+        counts[2] += sign
+    return 0.0
+
+
+@njit("UniTuple(float64, 2)(float64, float64, float64)", cache=True)
+def _neumaier_add_nb(s, c, x):
+    """Add ``x`` to the compensated sum ``s`` with compensation term ``c``."""
+    t = s + x
+    if abs(s) >= abs(x):
+        c += (s - t) + x
+    else:
+        c += (x - t) + s
+    return t, c
+
+
+@njit(
+    _array_signatures(
+        lambda a: types.void(a, types.int64, types.float64[::1], types.int64, types.int64)
+    ),
+    cache=True,
+)
+def _fill_moving_average_nb(arr, w, out, lo, hi):
+    """Write the moving averages ``out[lo:hi]`` of ``arr`` with a running sum.
+
+    Each output value is obtained from the previous one by adding the
+    element entering the window and subtracting the one leaving it. The
+    running sum is Neumaier-compensated, so the rounding error from a
+    large value does not linger after it leaves the window. Non-finite
+    values are counted instead of summed, so they only affect the windows
+    that contain them, as with :func:`numpy.convolve`.
+    """
+    counts = np.zeros(3, dtype=np.int64)
+    s = 0.0
+    c = 0.0
+    for j in range(lo, lo + w - 1):
+        s, c = _neumaier_add_nb(s, c, _window_update_nb(arr[j], 1, counts))
+    for i in range(lo, hi):
+        s, c = _neumaier_add_nb(s, c, _window_update_nb(arr[i + w - 1], 1, counts))
+        if counts[0] > 0 or (counts[1] > 0 and counts[2] > 0):
+            out[i] = np.nan
+        elif counts[1] > 0:
+            out[i] = np.inf
+        elif counts[2] > 0:
+            out[i] = -np.inf
+        else:
+            out[i] = (s + c) / w
+        s, c = _neumaier_add_nb(s, c, _window_update_nb(arr[i], -1, counts))
+
+
+@njit(_array_signatures(lambda a: types.float64[::1](a, types.int64)), cache=True)
+def _moving_average_nb(arr, w):
+    """Simple moving average of ``arr`` using a running window sum.
+
+    The array is traversed only once regardless of ``w``.
+    """
+    m = arr.shape[0] - w + 1
+    out = np.empty(m)
+    _fill_moving_average_nb(arr, w, out, 0, m)
+    return out
+
+
+@njit(
+    _array_signatures(lambda a: types.float64[::1](a, types.int64, types.int64)),
+    parallel=True,
+    cache=True,
+)
+def _moving_average_tiled_nb(arr, w, n_threads):
+    """Parallel variant of :func:`_moving_average_nb` for large arrays.
+
+    The output is split into one contiguous tile per thread. Each tile
+    seeds its own window sum and then slides it forward, so tiles are
+    independent at the cost of one extra ``O(w)`` sum each.
+    """
+    m = arr.shape[0] - w + 1
+    out = np.empty(m)
+    n_tiles = min(n_threads, m)
+    for t in prange(n_tiles):
+        _fill_moving_average_nb(arr, w, out, t * m // n_tiles, (t + 1) * m // n_tiles)
+    return out
+
+
+@njit(_array_signatures(lambda a: types.UniTuple(types.float64, 2)(a)), cache=True)
+def _mean_var_nb(arr):
+    """Population mean and variance of ``arr`` in one compensated pass.
+
+    Values are shifted by ``arr[0]`` so the ``E[x**2] - E[x]**2`` formula
+    does not cancel catastrophically when the mean is large compared to
+    the spread, and both sums use Neumaier's compensated summation. This
+    kernel is compiled without ``fastmath`` so the compensation terms are
+    not optimized away.
+    """
+    n = arr.shape[0]
+    if n == 0:
+        return np.nan, np.nan
+    shift = arr[0]
+    s = 0.0
+    c = 0.0
+    s2 = 0.0
+    c2 = 0.0
+    for i in range(n):
+        d = arr[i] - shift
+        t = s + d
+        if abs(s) >= abs(d):
+            c += (s - t) + d
+        else:
+            c += (d - t) + s
+        s = t
+
+        d2 = d * d
+        t = s2 + d2
+        if abs(s2) >= abs(d2):
+            c2 += (s2 - t) + d2
+        else:
+            c2 += (d2 - t) + s2
+        s2 = t
+    mean_d = (s + c) / n
+    var = (s2 + c2) / n - mean_d * mean_d
+    if var < 0.0:
+        var = 0.0
+    return shift + mean_d, var
+
+
+@njit(_array_signatures(lambda a: types.float64[::1](a)), parallel=True, cache=True)
+def _zscore_nb(arr):
+    """Z-scores of ``arr`` from one compensated moments pass and one write pass."""
+    mean, var = _mean_var_nb(arr)
+    std = np.sqrt(var)
+    if std == 0:
+        raise ValueError("Standard deviation is zero; z-scores are undefined")
+    inv_std = 1.0 / std
+    out = np.empty_like(arr)
+    for i in prange(arr.shape[0]):
+        out[i] = (arr[i] - mean) * inv_std
+    return out
+
+
+@njit(_array_signatures(lambda a: types.float64[::1](a)), parallel=True, cache=True)
+def _min_max_scale_nb(arr):
+    """Min-max scaling of ``arr`` with a fused min/max reduction pass.
+
+    As with NumPy, a single NaN makes every output value NaN.
+    """
+    n = arr.shape[0]
+    mn = np.inf
+    mx = -np.inf
+    n_nan = 0
+    for i in prange(n):
+        n_nan += np.isnan(arr[i])
+        mn = min(mn, arr[i])
+        mx = max(mx, arr[i])
+    if n_nan > 0:
+        return np.full_like(arr, np.nan)
+    if mn == mx:
+        raise ValueError("All values are equal; min-max scaling is undefined")
+    # Dividing (rather than multiplying by the reciprocal) maps the
+    # maximum to exactly 1.0, as the NumPy formula does.
+    rng = mx - mn
+    out = np.empty_like(arr)
+    for i in prange(n):
+        out[i] = (arr[i] - mn) / rng
+    return out
+
 
 class StatisticsUtils:
     """Collection of basic statistical helper functions.
@@ -43,15 +270,26 @@ class StatisticsUtils:
         if window <= 0:
             raise ValueError("window must be a positive integer")
 
-        arr = np.asarray(arr, dtype=float)
+        arr = np.asarray(arr, dtype=np.float64)
         if arr.ndim != 1:
             raise ValueError("moving_average only supports 1D sequences")
+        arr = np.ascontiguousarray(arr)
 
         if len(arr) < window:
             raise ValueError("window must not be larger than the array size")
 
-        kernel = np.ones(window, dtype=float) / window
-        return np.convolve(arr, kernel, mode="valid")
+        if _HAS_NUMBA and len(arr) - window + 1 >= _PARALLEL_SMA_MIN_SIZE:
+            return _moving_average_tiled_nb(arr, window, get_num_threads())
+        # bottleneck's running sum turns an infinity into NaN once it leaves
+        # the window, so inputs with infinities skip it.
+        if bn is not None and not np.isinf(arr).any():
+            # bottleneck pads the first window - 1 positions with NaN. Its running
+            # sum is not compensated, so it trades some precision for speed on
+            # data with a very large dynamic range (see README).
+            return bn.move_mean(arr, window=window)[window - 1:]
+        if _HAS_NUMBA:
+            return _moving_average_nb(arr, window)
+        return np.convolve(arr, _uniform_kernel(window), mode="valid")
 
     def zscore(self, arr: Sequence[float]) -> np.ndarray:
         """Return the z-score of each value in a numeric sequence.
@@ -77,7 +315,10 @@ class StatisticsUtils:
             If the standard deviation of the input is zero, which would
             lead to a division by zero.
         """
-        arr = np.asarray(arr, dtype=float)
+        arr = np.ascontiguousarray(arr, dtype=np.float64)
+        if _HAS_NUMBA:
+            return _zscore_nb(arr.ravel()).reshape(arr.shape)
+
         std = arr.std()
         if std == 0:
             raise ValueError("Standard deviation is zero; z-scores are undefined")
@@ -104,12 +345,19 @@ class StatisticsUtils:
         Raises
         ------
         ValueError
-            If all values in ``arr`` are equal, making the scaling
-            undefined.
+            If ``arr`` is empty or all its values are equal, making the
+            scaling undefined.
         """
-        arr = np.asarray(arr, dtype=float)
-        min_val = arr.min()
-        max_val = arr.max()
-        if min_val == max_val:
+        arr = np.ascontiguousarray(arr, dtype=np.float64)
+        if arr.size == 0:
+            raise ValueError("min_max_scale requires at least one value")
+        if _HAS_NUMBA:
+            return _min_max_scale_nb(arr.ravel()).reshape(arr.shape)
+
+        mn = arr.min()
+        rng = np.ptp(arr)
+        if rng == 0:
             raise ValueError("All values are equal; min-max scaling is undefined")
-        return (arr - min_val) / (max_val - min_val)
+        out = np.subtract(arr, mn)
+        out /= rng
+        return out
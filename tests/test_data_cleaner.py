@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import unittest
+from unittest import mock
 
+from src import data_cleaner
 from src.data_cleaner import DataCleaner
 
 
@@ -93,6 +96,25 @@ class TestDataCleaner(unittest.TestCase):
         - Verificar que se lanza un KeyError (usar self.assertRaises)
         """
 
+    def test_drop_invalid_rows_matches_dropna_for_numeric_and_mixed_subsets(self):
+        """Test que verifica que drop_invalid_rows da el mismo resultado que
+        DataFrame.dropna tanto para subconjuntos solo numéricos (int y float con NaN)
+        como para subconjuntos mixtos que incluyen un entero anulable (Int64).
+        """
+        df = pd.DataFrame({
+            "i": [1, 2, 3, 4],
+            "f": [1.5, np.nan, 3.5, 4.5],
+            "nullable": pd.array([1, 2, None, 4], dtype="Int64"),
+            "name": ["a", "b", "c", None],
+        })
+        cleaner = DataCleaner()
+
+        for cols in (["i", "f"], ["f", "nullable", "name"]):
+            with self.subTest(cols=cols):
+                result = cleaner.drop_invalid_rows(df, cols)
+
+                pdt.assert_frame_equal(result, df.dropna(subset=cols))
+
     def test_trim_strings_strips_whitespace_without_changing_other_columns(self):
         """Test que verifica que el método trim_strings elimina correctamente los espacios
         en blanco al inicio y final de los valores en las columnas especificadas, sin modificar
@@ -106,6 +128,19 @@ class TestDataCleaner(unittest.TestCase):
         - Verificar que las columnas no especificadas (ej: "city") permanecen sin cambios (si comparas Series completas, usar pandas.testing.assert_series_equal() ya que maneja mejor los índices y tipos de Pandas; si comparas valores individuales, self.assertEqual es suficiente)
         """
 
+    def test_trim_strings_accepts_non_string_column_labels(self):
+        """Test que verifica que trim_strings funciona con etiquetas de columna que no
+        son strings válidos como argumentos con nombre (enteros, tuplas, "self").
+        """
+        df = pd.DataFrame({0: [" a "], ("x", "y"): [" b"], "self": ["c "], "n": [1]})
+        cleaner = DataCleaner()
+
+        result = cleaner.trim_strings(df, [0, ("x", "y"), "self"])
+
+        expected = pd.DataFrame({0: ["a"], ("x", "y"): ["b"], "self": ["c"], "n": [1]})
+        pdt.assert_frame_equal(result, expected)
+        self.assertEqual(df.loc[0, 0], " a ")
+
     def test_trim_strings_raises_typeerror_for_non_string_column(self):
         """Test que verifica que el método trim_strings lanza un TypeError cuando
         se llama con una columna que no es de tipo string.
@@ -116,6 +151,91 @@ class TestDataCleaner(unittest.TestCase):
         - Verificar que se lanza un TypeError (usar self.assertRaises)
         """
 
+    def test_trim_strings_checks_values_of_object_columns(self):
+        """Test que verifica que trim_strings acepta columnas object que solo contienen
+        strings (con valores faltantes) y lanza TypeError si contienen otros valores.
+        """
+        df = pd.DataFrame({
+            "text": pd.Series([" a ", None], dtype=object),
+            "ints": pd.Series([1, 2], dtype=object),
+            "mixed": pd.Series([" a ", 5], dtype=object),
+        })
+        cleaner = DataCleaner()
+
+        result = cleaner.trim_strings(df, ["text"])
+        self.assertEqual(result["text"].tolist(), ["a", None])
+
+        for col in ["ints", "mixed"]:
+            with self.assertRaises(TypeError):
+                cleaner.trim_strings(df, [col])
+
+    def test_strip_series_matches_str_strip_for_each_dtype(self):
+        """Test que verifica que el recorte con Arrow da el mismo resultado que
+        Series.str.strip para columnas object y para cada dtype de strings,
+        conservando los valores faltantes (None / NaN / NA) y el dtype.
+        """
+        dtypes = [object, pd.StringDtype("python"), "str"]
+        if data_cleaner.pa is not None:
+            dtypes.append(pd.StringDtype("pyarrow"))
+        for dtype in dtypes:
+            with self.subTest(dtype=dtype):
+                values = [" a ", None, "\tb "]
+                if dtype is object:
+                    values.append(np.nan)
+                s = pd.Series(values, dtype=dtype, name="s")
+
+                pdt.assert_series_equal(data_cleaner._strip_series(s), s.str.strip())
+
+    def test_strip_series_falls_back_for_non_string_objects(self):
+        """Test que verifica que una columna object con valores que no son strings
+        (que Arrow no puede convertir) se recorta igual que con Series.str.strip.
+        """
+        s = pd.Series([" a ", 5, None], dtype=object)
+
+        pdt.assert_series_equal(data_cleaner._strip_series(s), s.str.strip())
+
+    @unittest.skipIf(data_cleaner.pa is None, "pyarrow no está instalado")
+    def test_strip_columns_batches_columns_and_falls_back_for_mixed_ones(self):
+        """Test que verifica el recorte de varias columnas a la vez mediante una tabla
+        de Arrow, y que si una columna mixta impide la conversión del lote, todas se
+        recortan igual que con Series.str.strip.
+        """
+        df = pd.DataFrame({
+            "a": pd.Series([" x ", None], dtype=object),
+            "b": pd.Series(["y\t", " z"], dtype=object),
+            "c": pd.Series([" p", None], dtype=pd.StringDtype("python")),
+            "mixed": pd.Series([" q ", 7], dtype=object),
+        })
+
+        for cols in (["a", "b", "c"], ["a", "b", "c", "mixed"]):
+            with self.subTest(cols=cols):
+                result = data_cleaner._strip_columns(df, cols, df.dtypes)
+
+                self.assertEqual(list(result), cols)
+                for c in cols:
+                    pdt.assert_series_equal(result[c], df[c].str.strip())
+
+    def test_trim_strings_without_pyarrow_keeps_missing_values(self):
+        """Test que verifica el recorte sin pyarrow (np.frompyfunc(str.strip)): los
+        valores faltantes se conservan y los valores que no son strings hacen que se
+        use Series.str.strip.
+        """
+        df = pd.DataFrame({
+            "obj": pd.Series([" a ", None, np.nan], dtype=object),
+            "py": pd.Series([" b", None, "c "], dtype=pd.StringDtype("python")),
+        })
+        mixed = pd.Series([" q ", 7, None], dtype=object)
+        cleaner = DataCleaner()
+
+        with mock.patch("src.data_cleaner.pa", None):
+            result = cleaner.trim_strings(df, ["obj", "py"])
+            mixed_result = data_cleaner._strip_series(mixed)
+
+        for c in ["obj", "py"]:
+            pdt.assert_series_equal(result[c], df[c].str.strip())
+        self.assertIs(result.loc[1, "obj"], None)
+        pdt.assert_series_equal(mixed_result, mixed.str.strip())
+
     def test_remove_outliers_iqr_removes_extreme_values(self):
         """Test que verifica que el método remove_outliers_iqr elimina correctamente los
         valores extremos (outliers) de una columna numérica usando el método del rango
@@ -128,6 +248,39 @@ class TestDataCleaner(unittest.TestCase):
         - Verificar que al menos uno de los valores no extremos (25 o 35) permanece en el resultado (usar self.assertIn para verificar que está presente)
         """
 
+    def test_remove_outliers_iqr_matches_pandas_quantiles(self):
+        """Test que verifica que remove_outliers_iqr conserva exactamente las filas
+        que están dentro de los límites calculados con Series.quantile, incluso
+        cuando la columna contiene valores faltantes.
+        """
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=501)
+        values[::7] = np.nan
+        values[::50] *= 10
+        df = pd.DataFrame({"x": values, "id": np.arange(values.size)})
+        cleaner = DataCleaner()
+
+        result = cleaner.remove_outliers_iqr(df, "x")
+
+        q1, q3 = df["x"].quantile([0.25, 0.75])
+        iqr = q3 - q1
+        expected = df[(df["x"] >= q1 - 1.5 * iqr) & (df["x"] <= q3 + 1.5 * iqr)]
+        pdt.assert_frame_equal(result, expected)
+
+    def test_quartiles_are_bit_identical_to_pandas(self):
+        """Test que verifica que los cuartiles usados por remove_outliers_iqr son
+        exactamente iguales (bit a bit) a los de Series.quantile, para que las filas
+        situadas justo en un límite se traten igual.
+        """
+        rng = np.random.default_rng(3)
+        for _ in range(500):
+            values = rng.normal(size=int(rng.integers(1, 200))) * rng.uniform(1, 1e6)
+
+            result = data_cleaner._quartiles(values)
+
+            expected = pd.Series(values).quantile([0.25, 0.75]).tolist()
+            self.assertEqual(list(result), expected)
+
     def test_remove_outliers_iqr_raises_keyerror_for_missing_column(self):
         """Test que verifica que el método remove_outliers_iqr lanza un KeyError cuando
         se llama con una columna que no existe en el DataFrame.
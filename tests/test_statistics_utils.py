@@ -1,6 +1,9 @@
 import numpy as np
 import numpy.testing as npt
+import pandas as pd
 import unittest
+import warnings
+from unittest import mock
 
 from src.statistics_utils import StatisticsUtils
 
@@ -76,6 +79,74 @@ class TestStatisticsUtils(unittest.TestCase):
         - Llamar a moving_average con esa secuencia y verificar que se lanza un ValueError indicando que solo se aceptan secuencias 1D (usar self.assertRaises)
         """
 
+    def test_moving_average_matches_convolution(self):
+        """Test que verifica que moving_average coincide con la media móvil calculada
+        mediante numpy.convolve con un kernel uniforme.
+        """
+        utils = StatisticsUtils()
+        rng = np.random.default_rng(0)
+        arr = rng.normal(size=1000)
+        result = utils.moving_average(arr, window=7)
+
+        expected = np.convolve(arr, np.ones(7) / 7, mode="valid")
+
+        npt.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+    def test_moving_average_non_finite_values_match_convolution(self):
+        """Test que verifica que los valores NaN e infinitos solo afectan a las
+        ventanas que los contienen, igual que con numpy.convolve, tanto en el kernel
+        de Numba como con bottleneck.
+        """
+        utils = StatisticsUtils()
+        arr = np.arange(20.0)
+        arr[2] = np.nan
+        arr[8] = np.inf
+        arr[13] = np.inf
+        arr[15] = -np.inf
+        expected = np.convolve(arr, np.ones(3) / 3, mode="valid")
+
+        with mock.patch("src.statistics_utils.bn", None):
+            result = utils.moving_average(arr, window=3)
+        npt.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+        # Con bottleneck instalado el resultado debe ser el mismo.
+        npt.assert_allclose(utils.moving_average(arr, window=3), expected, rtol=1e-10, atol=1e-10)
+
+    def test_moving_average_recovers_after_large_spike(self):
+        """Test que verifica que, tras un valor muy grande (1e12), las ventanas que ya
+        no lo contienen vuelven a coincidir con numpy.convolve, es decir, que el error
+        de redondeo de la suma acumulada no se arrastra (kernels en serie y por bloques).
+        """
+        utils = StatisticsUtils()
+        rng = np.random.default_rng(0)
+        arr = rng.normal(size=100_000)
+        arr[50_000] = 1e12
+        expected = np.convolve(arr, np.ones(20) / 20, mode="valid")
+
+        for min_size in (1_000_000, 1):
+            no_bn = mock.patch("src.statistics_utils.bn", None)
+            threshold = mock.patch("src.statistics_utils._PARALLEL_SMA_MIN_SIZE", min_size)
+            with self.subTest(min_size=min_size), no_bn, threshold:
+                result = utils.moving_average(arr, window=20)
+
+                npt.assert_allclose(result[50_001:], expected[50_001:], rtol=0, atol=1e-12)
+                npt.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_moving_average_large_array_matches_convolution(self):
+        """Test que verifica que moving_average coincide con numpy.convolve en un
+        array lo suficientemente grande como para repartir el cálculo entre hilos,
+        y que un NaN solo afecta a las ventanas que lo contienen.
+        """
+        utils = StatisticsUtils()
+        rng = np.random.default_rng(0)
+        arr = rng.normal(size=1_200_000)
+        arr[5] = np.nan
+        result = utils.moving_average(arr, window=25)
+
+        expected = np.convolve(arr, np.ones(25) / 25, mode="valid")
+
+        npt.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
     def test_zscore_has_mean_zero_and_unit_std(self):
         """Test que verifica que el método zscore calcula correctamente los z-scores
         de una secuencia numérica, comprobando que el resultado tiene media cero y
@@ -88,6 +159,20 @@ class TestStatisticsUtils(unittest.TestCase):
         - Verificar que la desviación estándar del resultado es aproximadamente 1 (usar self.assertAlmostEqual para un solo valor numérico - unittest es suficiente)
         """
 
+    def test_zscore_is_stable_for_large_offsets(self):
+        """Test que verifica que zscore sigue siendo preciso cuando la media es muy
+        grande en comparación con la dispersión de los datos (por ejemplo, lecturas
+        de sensores alrededor de 1e9).
+        """
+        utils = StatisticsUtils()
+        rng = np.random.default_rng(0)
+        noise = rng.normal(size=10_000)
+        result = utils.zscore(1e9 + noise)
+
+        expected = (noise - noise.mean()) / noise.std()
+
+        npt.assert_allclose(result, expected, rtol=1e-6, atol=1e-6)
+
     def test_zscore_raises_for_zero_std(self):
         """Test que verifica que el método zscore lanza un ValueError cuando
         se llama con una secuencia que tiene desviación estándar cero
@@ -110,6 +195,62 @@ class TestStatisticsUtils(unittest.TestCase):
         - Verificar que los valores transformados son correctos (ej: [0.0, 0.5, 1.0] para [2, 4, 6]) (usar numpy.testing.assert_allclose() para comparar el array completo - esto es necesario para comparar arrays de NumPy con tolerancia para errores de punto flotante)
         """
 
+    def test_min_max_scale_matches_numpy_reference(self):
+        """Test que verifica que min_max_scale coincide con la fórmula
+        (x - min) / (max - min) calculada con NumPy sobre un array grande.
+        """
+        utils = StatisticsUtils()
+        rng = np.random.default_rng(0)
+        arr = rng.uniform(-50.0, 50.0, size=100_000)
+        result = utils.min_max_scale(arr)
+
+        expected = (arr - arr.min()) / np.ptp(arr)
+
+        npt.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_nan_and_empty_inputs_match_across_backends(self):
+        """Test que verifica que zscore y min_max_scale se comportan igual con y sin
+        Numba ante valores NaN, infinitos y secuencias vacías, y que el máximo se
+        escala exactamente a 1.0.
+        """
+        utils = StatisticsUtils()
+        for has_numba in (True, False):
+            patch_numba = mock.patch("src.statistics_utils._HAS_NUMBA", has_numba)
+            with self.subTest(has_numba=has_numba), patch_numba, warnings.catch_warnings():
+                # NumPy warns about NaN and empty reductions; only the results matter here.
+                warnings.simplefilter("ignore", RuntimeWarning)
+                self.assertTrue(np.isnan(utils.zscore([1.0, np.nan, 3.0])).all())
+                self.assertTrue(np.isnan(utils.zscore([1.0, np.inf])).all())
+                self.assertEqual(utils.zscore([]).shape, (0,))
+                self.assertTrue(np.isnan(utils.min_max_scale([1.0, np.nan, 3.0])).all())
+                with self.assertRaises(ValueError):
+                    utils.min_max_scale([])
+                for top in range(1, 200):
+                    scaled = utils.min_max_scale([0.0, float(top)])
+                    self.assertEqual(scaled[-1], 1.0)
+
+    def test_methods_accept_series_and_read_only_arrays(self):
+        """Test que verifica que los tres métodos aceptan una pandas.Series y un array
+        de NumPy de solo lectura (como los que devuelve pandas con copy-on-write),
+        también en los kernels de media móvil en serie y por bloques.
+        """
+        utils = StatisticsUtils()
+        values = np.array([4.0, 1.0, 3.0, 8.0, 5.0])
+        read_only = values.copy()
+        read_only.setflags(write=False)
+
+        for arr in (pd.Series(values), read_only):
+            with self.subTest(type=type(arr).__name__):
+                npt.assert_allclose(utils.zscore(arr), (values - values.mean()) / values.std())
+                npt.assert_allclose(utils.min_max_scale(arr), (values - 1.0) / 7.0)
+                expected = np.convolve(values, np.ones(2) / 2, mode="valid")
+                # Sin bottleneck: kernel en serie y, con un umbral de 1, kernel por bloques.
+                for min_size in (1_000_000, 1):
+                    no_bn = mock.patch("src.statistics_utils.bn", None)
+                    threshold = mock.patch("src.statistics_utils._PARALLEL_SMA_MIN_SIZE", min_size)
+                    with no_bn, threshold:
+                        npt.assert_allclose(utils.moving_average(arr, window=2), expected)
+
     def test_min_max_scale_raises_for_constant_values(self):
         """Test que verifica que el método min_max_scale lanza un ValueError cuando
         se llama con una secuencia donde todos los valores son iguales (no hay variación).